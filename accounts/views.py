@@ -1,8 +1,9 @@
-from django.http import JsonResponse
+from django.http import HttpResponse, JsonResponse
 from django.views.decorators.csrf import csrf_exempt
-import json
 import logging
 
+import orjson
+
 logger = logging.getLogger(__name__)
 
 def home(request):
@@ -12,14 +13,15 @@ def home(request):
 def webhook_tests(request):
     if request.method == "POST":
         try:
-            payload = json.loads(request.body.decode("utf-8"))
-            print('Received webhook payload:')
-            print(payload)
-            logger.info(f"Received webhook payload: {payload}")
-            # You can process the payload here
-
-            return JsonResponse({"status": "success", "data": payload}, status=200)
-        except json.JSONDecodeError:
+            payload = orjson.loads(request.body)
+        except orjson.JSONDecodeError:
             return JsonResponse({"error": "Invalid JSON"}, status=400)
+
+        # Payloads can be large, so only log them when debugging
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Received webhook payload: %s", payload)
+        # You can process the payload here
+
+        return HttpResponse(orjson.dumps({"status": "success", "data": payload}), content_type="application/json", status=200)
     else:
         return JsonResponse({"error": "Only POST method allowed"}, status=405)
@@ -22,7 +22,7 @@ class ApiKeyAuthentication(authentication.BaseAuthentication):
 
         try:
             key_hash = hashlib.sha256(api_key.encode()).hexdigest()
-            api_key_obj = ApiKey.objects.select_related("project").get(key_hash=key_hash, disabled_at__isnull=True)
+            api_key_obj = ApiKey.objects.select_related("project__organization").get(key_hash=key_hash, disabled_at__isnull=True)
         except ApiKey.DoesNotExist:
             raise exceptions.AuthenticationFailed({"detail": "Invalid or disabled API key"})
 
@@ -1,3 +1,3 @@
-from .bot_pod_creator import BotPodCreator
+from .bot_pod_creator import BotPodCreator, get_bot_pod_creator
 
-__all__ = ["BotPodCreator"]
+__all__ = ["BotPodCreator", "get_bot_pod_creator"]
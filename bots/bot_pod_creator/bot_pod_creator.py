@@ -1,14 +1,23 @@
+import functools
+import json
+import logging
 import os
+import re
 import uuid
 from typing import Dict, Optional
 
 from kubernetes import client, config
 
+logger = logging.getLogger(__name__)
+
+# Kubernetes requires valid quantity strings: 250m, 1Gi, etc.
+_RESOURCE_QTY_RE = re.compile(r'^([+-]?[0-9.]+)([eEinumkKMGTP]*[-+]?[0-9]*)$')
+
 class BotPodCreator:
     def __init__(self, namespace: str = "mi"):
         # Use in-cluster config
         config.load_incluster_config()
-        print("Using in-cluster config")
+        logger.info("Using in-cluster config")
 
         self.v1 = client.CoreV1Api()
         self.namespace = namespace
@@ -24,6 +33,58 @@ class BotPodCreator:
         # Validate and store resource limits and requests
         self.resources = self._get_resource_limits()
 
+        # Everything except the pod name and command is the same for every bot, so build
+        # the pod body once as plain JSON. Sending a dict skips the kubernetes client's
+        # model construction and serialization on every launch.
+        self.pod_template = {
+            "apiVersion": "v1",
+            "kind": "Pod",
+            "metadata": {
+                "namespace": self.namespace,
+                "labels": {
+                    "app.kubernetes.io/name": self.app_name,
+                    "app.kubernetes.io/instance": self.app_instance,
+                    "app.kubernetes.io/version": self.app_version,
+                    "app.kubernetes.io/managed-by": "cuber",
+                    "app": "bot-proc"
+                }
+            },
+            "spec": {
+                "containers": [
+                    {
+                        "name": "bot-proc",
+                        "image": self.image,
+                        "imagePullPolicy": "Always",
+                        "resources": self.resources,
+                        "envFrom": [
+                            {"configMapRef": {"name": "mi-env"}},
+                            {"secretRef": {"name": "app-secrets"}}
+                        ],
+                        "env": []
+                    }
+                ],
+                "restartPolicy": "Never",
+                "imagePullSecrets": [
+                    {"name": "regcred"}
+                ],
+                "terminationGracePeriodSeconds": 60,
+                "tolerations": [
+                    {
+                        "key": "node.kubernetes.io/not-ready",
+                        "operator": "Exists",
+                        "effect": "NoExecute",
+                        "tolerationSeconds": 900
+                    },
+                    {
+                        "key": "node.kubernetes.io/unreachable",
+                        "operator": "Exists",
+                        "effect": "NoExecute",
+                        "tolerationSeconds": 900
+                    }
+                ]
+            }
+        }
+
     def _get_resource_limits(self) -> Dict:
         def clean(key: str, default: str) -> str:
             val = os.getenv(key, default).strip()
@@ -36,11 +97,8 @@ class BotPodCreator:
         memory_limit = clean("BOT_MEMORY_LIMIT", "500Mi")
         storage_limit = clean("BOT_EPHEMERAL_STORAGE_LIMIT", "1Gi")
 
-        # Kubernetes requires valid quantity strings: 250m, 1Gi, etc.
-        valid_regex = r'^([+-]?[0-9.]+)([eEinumkKMGTP]*[-+]?[0-9]*)$'
-        import re
         for val in [cpu_request, memory_request, storage_request, memory_limit, storage_limit]:
-            if not re.match(valid_regex, val):
+            if not _RESOURCE_QTY_RE.match(val):
                 raise ValueError(f"Invalid resource quantity format: {val}")
 
         return {
@@ -62,72 +120,25 @@ class BotPodCreator:
         bot_cmd = f"python manage.py run_bot --botid {bot_id}"
         command = ["/bin/bash", "-c", f"/opt/bin/entrypoint.sh && {bot_cmd}"]
 
-        labels = {
-            "app.kubernetes.io/name": self.app_name,
-            "app.kubernetes.io/instance": self.app_instance,
-            "app.kubernetes.io/version": self.app_version,
-            "app.kubernetes.io/managed-by": "cuber",
-            "app": "bot-proc"
+        # Copy only the parts that differ per bot, the rest is shared with the template
+        container = {**self.pod_template["spec"]["containers"][0], "command": command}
+        pod = {
+            **self.pod_template,
+            "metadata": {**self.pod_template["metadata"], "name": bot_name},
+            "spec": {**self.pod_template["spec"], "containers": [container]}
         }
 
-        pod = client.V1Pod(
-            metadata=client.V1ObjectMeta(
-                name=bot_name,
-                namespace=self.namespace,
-                labels=labels
-            ),
-            spec=client.V1PodSpec(
-                containers=[
-                    client.V1Container(
-                        name="bot-proc",
-                        image=self.image,
-                        image_pull_policy="Always",
-                        command=command,
-                        resources=client.V1ResourceRequirements(
-                            requests=self.resources["requests"],
-                            limits=self.resources["limits"]
-                        ),
-                        env_from=[
-                            client.V1EnvFromSource(
-                                config_map_ref=client.V1ConfigMapEnvSource(name="mi-env")
-                            ),
-                            client.V1EnvFromSource(
-                                secret_ref=client.V1SecretEnvSource(name="app-secrets")
-                            )
-                        ],
-                        env=[]
-                    )
-                ],
-                restart_policy="Never",
-                image_pull_secrets=[
-                    client.V1LocalObjectReference(name="regcred")
-                ],
-                termination_grace_period_seconds=60,
-                tolerations=[
-                    client.V1Toleration(
-                        key="node.kubernetes.io/not-ready",
-                        operator="Exists",
-                        effect="NoExecute",
-                        toleration_seconds=900
-                    ),
-                    client.V1Toleration(
-                        key="node.kubernetes.io/unreachable",
-                        operator="Exists",
-                        effect="NoExecute",
-                        toleration_seconds=900
-                    )
-                ]
-            )
-        )
-
         try:
+            # Skip deserializing the whole returned pod, we only need its name and phase
             api_response = self.v1.create_namespaced_pod(
                 namespace=self.namespace,
-                body=pod
+                body=pod,
+                _preload_content=False
             )
+            created_pod = json.loads(api_response.data)
             return {
-                "name": api_response.metadata.name,
-                "status": api_response.status.phase,
+                "name": created_pod["metadata"]["name"],
+                "status": created_pod.get("status", {}).get("phase"),
                 "created": True,
                 "image": self.image,
                 "app_instance": self.app_instance,
@@ -155,3 +166,10 @@ class BotPodCreator:
                 "deleted": False,
                 "error": str(e)
             }
+
+
+@functools.lru_cache(maxsize=1)
+def get_bot_pod_creator() -> BotPodCreator:
+    # Loading the in-cluster config and building the API client is expensive, so
+    # reuse one creator (and its connection pool) across launches
+    return BotPodCreator()
@@ -1,12 +1,14 @@
-import json
+import atexit
+import base64
 import logging
 import os
 from enum import Enum
 
+import orjson
 import redis
 from django.core.exceptions import ValidationError
 from django.db import transaction
-from django.urls import reverse
+from django.utils.dateparse import parse_datetime
 
 from .models import (
     Bot,
@@ -14,99 +16,176 @@ from .models import (
     BotEventTypes,
     BotMediaRequest,
     BotMediaRequestMediaTypes,
+    BotStates,
     Credentials,
     MediaBlob,
     MeetingTypes,
     Project,
     Recording,
+    RecordingStates,
+    RecordingTranscriptionStates,
     RecordingTypes,
     TranscriptionTypes,
 )
 from .serializers import (
     CreateBotSerializer,
 )
-from .tasks import run_bot
+from .tasks import launch_bot_task, run_bot
 from .utils import meeting_type_from_url, transcription_provider_from_meeting_url_and_transcription_settings
 
 logger = logging.getLogger(__name__)
 
+_redis_client = None
+
+
+def _redis():
+    # One client per process, so publishes reuse pooled connections instead of
+    # opening a new one for every command. from_url also handles unix:// URLs.
+    global _redis_client
+    if _redis_client is None:
+        _redis_client = redis.from_url(
+            os.getenv("REDIS_URL"),
+            socket_keepalive=True,
+            health_check_interval=30,
+            max_connections=64,
+        )
+    return _redis_client
+
+
+@atexit.register
+def _close_redis():
+    if _redis_client is not None:
+        _redis_client.close()
+
+
+def send_sync_commands(bots_and_commands):
+    """
+    Publishes a command to each bot in a single round trip to Redis.
+    Takes a list of (bot, command) tuples.
+    """
+    with _redis().pipeline(transaction=False) as pipe:
+        for bot, command in bots_and_commands:
+            channel = f"bot_{bot.id}"
+            message = {"command": command}
+            pipe.publish(channel, orjson.dumps(message))
+        pipe.execute()
+
 
 def send_sync_command(bot, command="sync"):
-    redis_url = os.getenv("REDIS_URL")
-    redis_client = redis.from_url(redis_url)
-    channel = f"bot_{bot.id}"
-    message = {"command": command}
-    redis_client.publish(channel, json.dumps(message))
+    send_sync_commands([(bot, command)])
+
+
+def create_bot_pod(bot):
+    from .bot_pod_creator import get_bot_pod_creator
+
+    create_pod_result = get_bot_pod_creator().create_bot_pod(bot_id=bot.id, bot_name=bot.k8s_pod_name())
+    if create_pod_result["created"]:
+        logger.info(f"Bot {bot.id} launched via Kubernetes: {create_pod_result}")
+    else:
+        logger.error(f"Bot {bot.id} failed to launch via Kubernetes: {create_pod_result}")
 
 
 def launch_bot(bot):
     # If this instance is running in Kubernetes, use the Kubernetes pod creator
-    # which spins up a new pod for the bot
+    # which spins up a new pod for the bot. The pod is created from a celery task
+    # so callers don't wait on the Kubernetes API.
     if os.getenv("LAUNCH_BOT_METHOD") == "kubernetes":
-        from .bot_pod_creator import BotPodCreator
-
-        bot_pod_creator = BotPodCreator()
-        create_pod_result = bot_pod_creator.create_bot_pod(bot_id=bot.id, bot_name=bot.k8s_pod_name())
-        logger.info(f"Bot {bot.id} launched via Kubernetes: {create_pod_result}")
+        launch_bot_task.delay(bot.id)
     else:
         # Default to launching bot via celery
         run_bot.delay(bot.id)
 
 
-def create_bot_media_request_for_image(bot, image):
+def create_media_blob_for_image(project, image):
     content_type = image["type"]
     image_data = image["decoded_data"]
     try:
         # Create or get existing MediaBlob
-        media_blob = MediaBlob.get_or_create_from_blob(project=bot.project, blob=image_data, content_type=content_type)
+        return MediaBlob.get_or_create_from_blob(project=project, blob=image_data, content_type=content_type)
     except Exception as e:
         error_message_first_line = str(e).split("\n")[0]
         logging.error(f"Error creating image blob: {error_message_first_line} (content_type={content_type})")
         raise ValidationError(f"Error creating the image blob: {error_message_first_line}.")
 
-    # Create BotMediaRequest
-    BotMediaRequest.objects.create(
-        bot=bot,
-        media_blob=media_blob,
-        media_type=BotMediaRequestMediaTypes.IMAGE,
-    )
 
-
-def validate_meeting_url_and_credentials(meeting_url, project):
+def validate_meeting_url_and_credentials(meeting_url, project, meeting_type=None):
     """
     Validates meeting URL format and required credentials.
     Returns error message if validation fails, None if validation succeeds.
     """
 
-    if meeting_type_from_url(meeting_url) == MeetingTypes.ZOOM:
-        zoom_credentials = project.credentials.filter(credential_type=Credentials.CredentialTypes.ZOOM_OAUTH).first()
-        if not zoom_credentials:
+    if meeting_type is None:
+        meeting_type = meeting_type_from_url(meeting_url)
+
+    if meeting_type == MeetingTypes.ZOOM:
+        has_zoom_credentials = project.credentials.filter(credential_type=Credentials.CredentialTypes.ZOOM_OAUTH).exists()
+        if not has_zoom_credentials:
             return {"error": "Zoom App credentials are required to create a Zoom bot. Please contact admin for Zoom credentials."}
 
     return None
 
 
+def encode_transcript_cursor(updated_at, utterance_id):
+    return base64.urlsafe_b64encode(f"{updated_at.isoformat()}|{utterance_id}".encode()).decode()
+
+
+def decode_transcript_cursor(cursor):
+    """
+    Decodes a transcript cursor into an (updated_at, utterance_id) tuple.
+    An empty cursor means start from the beginning and returns None.
+    Raises ValueError if the cursor is malformed.
+    """
+    if not cursor:
+        return None
+    try:
+        updated_at_str, utterance_id_str = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        updated_at = parse_datetime(updated_at_str)
+        utterance_id = int(utterance_id_str)
+    except Exception:
+        raise ValueError("Invalid cursor")
+    if not updated_at:
+        raise ValueError("Invalid cursor")
+    return updated_at, utterance_id
+
+
 class BotCreationSource(str, Enum):
     API = "api"
     DASHBOARD = "dashboard"
 
 
-def create_bot(data: dict, source: BotCreationSource, project: Project) -> tuple[Bot | None, dict | None]:
+def newly_created_bot_data(bot, recording, join_requested_event):
+    """
+    Returns the same data as BotSerializer for a bot that create_bot just created,
+    built from the objects already in memory instead of querying them again.
+    """
+    return {
+        "id": bot.object_id,
+        "metadata": bot.metadata,
+        "meeting_url": bot.meeting_url,
+        "state": BotStates.state_to_api_code(bot.state),
+        "events": [{"type": BotEventTypes.type_to_api_code(join_requested_event.event_type), "created_at": join_requested_event.created_at}],
+        "transcription_state": RecordingTranscriptionStates.state_to_api_code(recording.transcription_state),
+        "recording_state": RecordingStates.state_to_api_code(recording.state),
+    }
+
+
+def create_bot(data: dict, source: BotCreationSource, project: Project) -> tuple[Bot | None, dict | None, dict | None]:
     # Given them a small grace period before we start rejecting requests
     if project.organization.credits() < -1:
         logger.error(f"Organization {project.organization.id} has insufficient credits. Please add credits in the Settings -> Billing page.")
-        return None, {"error": "Organization has run out of credits. Please add more credits in the Settings -> Billing page."}
+        return None, None, {"error": "Organization has run out of credits. Please add more credits in the Settings -> Billing page."}
 
     serializer = CreateBotSerializer(data=data)
     if not serializer.is_valid():
-        return None, serializer.errors
+        return None, None, serializer.errors
 
     # Access the bot through the api key
     meeting_url = serializer.validated_data["meeting_url"]
+    meeting_type = meeting_type_from_url(meeting_url)
 
-    error = validate_meeting_url_and_credentials(meeting_url, project)
+    error = validate_meeting_url_and_credentials(meeting_url, project, meeting_type)
     if error:
-        return None, error
+        return None, None, error
 
     bot_name = serializer.validated_data["bot_name"]
     transcription_settings = serializer.validated_data["transcription_settings"]
@@ -125,6 +204,15 @@ def create_bot(data: dict, source: BotCreationSource, project: Project) -> tuple
         "automatic_leave_settings": automatic_leave_settings,
     }
 
+    # Store the image blob before opening the transaction, so hashing and writing it
+    # doesn't hold the transaction open
+    bot_image_media_blob = None
+    if bot_image:
+        try:
+            bot_image_media_blob = create_media_blob_for_image(project, bot_image)
+        except ValidationError as e:
+            return None, None, {"error": e.messages[0]}
+
     with transaction.atomic():
         bot = Bot.objects.create(
             project=project,
@@ -134,21 +222,25 @@ def create_bot(data: dict, source: BotCreationSource, project: Project) -> tuple
             metadata=metadata,
         )
 
-        Recording.objects.create(
+        recording = Recording.objects.create(
             bot=bot,
             recording_type=RecordingTypes.AUDIO_AND_VIDEO,
             transcription_type=TranscriptionTypes.NON_REALTIME,
-            transcription_provider=transcription_provider_from_meeting_url_and_transcription_settings(meeting_url, transcription_settings),
+            transcription_provider=transcription_provider_from_meeting_url_and_transcription_settings(meeting_url, transcription_settings, meeting_type=meeting_type),
             is_default_recording=True,
         )
 
-        if bot_image:
-            try:
-                create_bot_media_request_for_image(bot, bot_image)
-            except ValidationError as e:
-                return None, {"error": e.messages[0]}
+        if bot_image_media_blob:
+            BotMediaRequest.objects.create(
+                bot=bot,
+                media_blob=bot_image_media_blob,
+                media_type=BotMediaRequestMediaTypes.IMAGE,
+            )
 
         # Try to transition the state from READY to JOINING
-        BotEventManager.create_event(bot=bot, event_type=BotEventTypes.JOIN_REQUESTED, event_metadata={"source": source})
+        join_requested_event = BotEventManager.create_event(bot=bot, event_type=BotEventTypes.JOIN_REQUESTED, event_metadata={"source": source})
+
+        # Only launch the bot once its rows are committed, so it never starts before they are visible
+        transaction.on_commit(lambda: launch_bot(bot))
 
-        return bot, None
+        return bot, newly_created_bot_data(bot, recording, join_requested_event), None
@@ -1,12 +1,13 @@
 import logging
 
 from django.core.exceptions import ValidationError
-from django.urls import reverse
+from django.db.models import Q, prefetch_related_objects
 from django.utils.dateparse import parse_datetime
 from drf_spectacular.utils import (
     OpenApiExample,
     OpenApiParameter,
     OpenApiResponse,
+    PolymorphicProxySerializer,
     extend_schema,
 )
 from rest_framework import status
@@ -14,31 +15,23 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from .authentication import ApiKeyAuthentication
-from .bots_api_utils import BotCreationSource, create_bot, create_bot_media_request_for_image, launch_bot, send_sync_command
+from .bots_api_utils import BotCreationSource, create_bot, decode_transcript_cursor, encode_transcript_cursor, send_sync_command
 from .models import (
+    NON_EMPTY_TRANSCRIPT_Q,
     Bot,
     BotEventManager,
     BotEventSubTypes,
     BotEventTypes,
-    BotMediaRequest,
-    BotMediaRequestMediaTypes,
-    BotMediaRequestStates,
-    BotStates,
-    Credentials,
-    MediaBlob,
-    MeetingTypes,
-    Recording,
+    BotQuerySet,
     Utterance,
 )
 from .serializers import (
-    BotImageSerializer,
     BotSerializer,
     CreateBotSerializer,
     RecordingSerializer,
-    SpeechSerializer,
+    TranscriptPageSerializer,
     TranscriptUtteranceSerializer,
 )
-from .utils import meeting_type_from_url
 
 TokenHeaderParameter = [
     OpenApiParameter(
@@ -76,6 +69,27 @@ LeavingBotExample = OpenApiExample(
     description="Example response when requesting a bot to leave",
 )
 
+# Maximum number of utterances returned per page when paginating a transcript with a cursor
+TRANSCRIPT_PAGE_SIZE = 500
+
+TranscriptPageExample = OpenApiExample(
+    "Transcript page",
+    value={
+        "utterances": [
+            {
+                "speaker_name": "Alice",
+                "speaker_uuid": "16778240",
+                "speaker_user_uuid": None,
+                "timestamp_ms": 1705581296000,
+                "duration_ms": 4200,
+                "transcription": {"transcript": "Let's get started."},
+            }
+        ],
+        "next_cursor": "MjAyNC0wMS0xOFQxMjozNTowMC4xMjM0NTYrMDA6MDB8NDI=",
+    },
+    description="Example response when paginating the transcript with the cursor parameter",
+)
+
 NewlyCreatedBotExample = OpenApiExample(
     "New bot",
     value={
@@ -131,13 +145,11 @@ class BotCreateView(APIView):
         tags=["Bots"],
     )
     def post(self, request):
-        bot, error = create_bot(data=request.data, source=BotCreationSource.API, project=request.auth.project)
+        bot, bot_data, error = create_bot(data=request.data, source=BotCreationSource.API, project=request.auth.project)
         if error:
             return Response(error, status=status.HTTP_400_BAD_REQUEST)
 
-        launch_bot(bot)
-
-        return Response(BotSerializer(bot).data, status=status.HTTP_201_CREATED)
+        return Response(bot_data, status=status.HTTP_201_CREATED)
 
 
 
@@ -179,6 +191,9 @@ class BotLeaveView(APIView):
 
             send_sync_command(bot)
 
+            # Prefetch after creating the event, so the response includes it
+            prefetch_related_objects([bot], *BotQuerySet.DETAIL_PREFETCH_RELATED)
+
             return Response(BotSerializer(bot).data, status=status.HTTP_200_OK)
         except ValidationError as e:
             logging.error(f"Error leaving meeting: {str(e)} (bot_id={object_id})")
@@ -214,9 +229,9 @@ class RecordingView(APIView):
     )
     def get(self, request, object_id):
         try:
-            bot = Bot.objects.get(object_id=object_id, project=request.auth.project)
+            bot = Bot.objects.for_recording().get(object_id=object_id, project=request.auth.project)
 
-            recording = Recording.objects.filter(bot=bot, is_default_recording=True).first()
+            recording = bot.default_recording()
             if not recording:
                 return Response(
                     {"error": "No recording found for bot"},
@@ -245,8 +260,14 @@ class TranscriptView(APIView):
         description="If the meeting is still in progress, this returns the transcript so far.",
         responses={
             200: OpenApiResponse(
-                response=TranscriptUtteranceSerializer(many=True),
-                description="List of transcribed utterances",
+                response=PolymorphicProxySerializer(
+                    component_name="TranscriptResponse",
+                    serializers=[TranscriptUtteranceSerializer(many=True), TranscriptPageSerializer],
+                    resource_type_field_name=None,
+                    many=False,
+                ),
+                description="List of transcribed utterances, or a page of them with a next_cursor when the cursor parameter is passed",
+                examples=[TranscriptPageExample],
             ),
             404: OpenApiResponse(description="Bot not found"),
         },
@@ -267,22 +288,29 @@ class TranscriptView(APIView):
                 required=False,
                 examples=[OpenApiExample("DateTime Example", value="2024-01-18T12:34:56Z")],
             ),
+            OpenApiParameter(
+                name="cursor",
+                type=str,
+                location=OpenApiParameter.QUERY,
+                description=f"Paginate the transcript by last update time. Pass an empty cursor to start from the beginning, then pass the next_cursor from each response to get only entries updated or created since. When this parameter is present, the response is an object with 'utterances' (at most {TRANSCRIPT_PAGE_SIZE}, ordered by last update) and 'next_cursor' instead of a list.",
+                required=False,
+            ),
         ],
         tags=["Bots"],
     )
     def get(self, request, object_id):
         try:
-            bot = Bot.objects.get(object_id=object_id, project=request.auth.project)
+            bot = Bot.objects.for_recording().get(object_id=object_id, project=request.auth.project)
 
-            recording = Recording.objects.filter(bot=bot, is_default_recording=True).first()
+            recording = bot.default_recording()
             if not recording:
                 return Response(
                     {"error": "No recording found for bot"},
                     status=status.HTTP_404_NOT_FOUND,
                 )
 
-            # Get all utterances with transcriptions, sorted by timeline
-            utterances_query = Utterance.objects.select_related("participant").filter(recording=recording, transcription__isnull=False)
+            # Get all utterances with non-empty transcriptions, sorted by timeline
+            utterances_query = Utterance.objects.filter(NON_EMPTY_TRANSCRIPT_Q, recording=recording)
 
             # Apply updated_after filter if provided
             updated_after = request.query_params.get("updated_after")
@@ -299,25 +327,59 @@ class TranscriptView(APIView):
                     )
                 utterances_query = utterances_query.filter(updated_at__gt=updated_after_datetime)
 
-            # Apply ordering
-            utterances = utterances_query.order_by("timestamp_ms")
-
-            # Format the response, skipping empty transcriptions
-            transcript_data = [
-                {
-                    "speaker_name": utterance.participant.full_name,
-                    "speaker_uuid": utterance.participant.uuid,
-                    "speaker_user_uuid": utterance.participant.user_uuid,
-                    "timestamp_ms": utterance.timestamp_ms,
-                    "duration_ms": utterance.duration_ms,
-                    "transcription": utterance.transcription,
-                }
-                for utterance in utterances
-                if utterance.transcription.get("transcript", "")
-            ]
-
-            serializer = TranscriptUtteranceSerializer(transcript_data, many=True)
-            return Response(serializer.data)
+            # Apply cursor pagination if requested
+            paginate = "cursor" in request.query_params
+            if paginate:
+                try:
+                    cursor_position = decode_transcript_cursor(request.query_params.get("cursor"))
+                except ValueError:
+                    return Response(
+                        {"error": "Invalid cursor. Use the next_cursor value from a previous response."},
+                        status=status.HTTP_400_BAD_REQUEST,
+                    )
+                if cursor_position:
+                    cursor_updated_at, cursor_id = cursor_position
+                    utterances_query = utterances_query.filter(Q(updated_at__gt=cursor_updated_at) | Q(updated_at=cursor_updated_at, id__gt=cursor_id))
+                utterances_query = utterances_query.order_by("updated_at", "id")[:TRANSCRIPT_PAGE_SIZE]
+            else:
+                utterances_query = utterances_query.order_by("timestamp_ms")
+
+            # Fetch only the columns we return, streaming rows so long transcripts aren't held in memory twice
+            utterances = utterances_query.values(
+                "id",
+                "updated_at",
+                "participant__full_name",
+                "participant__uuid",
+                "participant__user_uuid",
+                "timestamp_ms",
+                "duration_ms",
+                "transcription",
+            ).iterator(chunk_size=500)
+
+            # The rows already match TranscriptUtteranceSerializer, so skip the serializer pass
+            transcript_data = []
+            last_utterance = None
+            for utterance in utterances:
+                transcript_data.append(
+                    {
+                        "speaker_name": utterance["participant__full_name"],
+                        "speaker_uuid": utterance["participant__uuid"],
+                        "speaker_user_uuid": utterance["participant__user_uuid"],
+                        "timestamp_ms": utterance["timestamp_ms"],
+                        "duration_ms": utterance["duration_ms"],
+                        "transcription": utterance["transcription"],
+                    }
+                )
+                last_utterance = utterance
+
+            if not paginate:
+                return Response(transcript_data)
+
+            # If there were no new utterances, the client keeps polling with the same cursor
+            next_cursor = request.query_params.get("cursor")
+            if last_utterance:
+                next_cursor = encode_transcript_cursor(last_utterance["updated_at"], last_utterance["id"])
+            return Response({"utterances": transcript_data, "next_cursor": next_cursor})
 
         except Bot.DoesNotExist:
             return Response({"error": "Bot not found"}, status=status.HTTP_404_NOT_FOUND)
@@ -351,7 +413,7 @@ class BotDetailView(APIView):
     )
     def get(self, request, object_id):
         try:
-            bot = Bot.objects.get(object_id=object_id, project=request.auth.project)
+            bot = Bot.objects.for_detail().get(object_id=object_id, project=request.auth.project)
             return Response(BotSerializer(bot).data)
 
         except Bot.DoesNotExist:
@@ -126,9 +126,23 @@ class RecordingViews(models.TextChoices):
     GALLERY_VIEW = "gallery_view"
 
 
+class BotQuerySet(models.QuerySet):
+    # The relations BotSerializer reads
+    DETAIL_PREFETCH_RELATED = ("bot_events", "recordings")
+
+    def for_detail(self):
+        return self.prefetch_related(*self.DETAIL_PREFETCH_RELATED)
+
+    # For views that only need the bot's default recording
+    def for_recording(self):
+        return self.prefetch_related("recordings")
+
+
 class Bot(models.Model):
     OBJECT_ID_PREFIX = "bot_"
 
+    objects = BotQuerySet.as_manager()
+
     object_id = models.CharField(max_length=32, unique=True, editable=False)
 
     project = models.ForeignKey(Project, on_delete=models.PROTECT, related_name="bots")
@@ -299,6 +313,10 @@ class Bot(models.Model):
             debug_settings = {}
         return debug_settings.get("create_debug_recording", False)
 
+    def default_recording(self):
+        # Filter in Python so this uses the recordings prefetched by BotQuerySet.for_detail
+        return next((recording for recording in self.recordings.all() if recording.is_default_recording), None)
+
     def last_bot_event(self):
         return self.bot_events.order_by("-created_at").first()
 
@@ -1101,6 +1119,12 @@ class TranscriptionFailureReasons(models.TextChoices):
     UTTERANCES_STILL_IN_PROGRESS_WHEN_RECORDING_TERMINATED = "utterances_still_in_progress_when_recording_terminated"
 
 
+# Matches utterances whose transcription has a non-empty transcript. The transcript key must exist
+# and be neither "" nor JSON null (which isnull=False doesn't exclude). Queries should use this
+# exact filter so Postgres can match it against the partial index on Utterance.
+NON_EMPTY_TRANSCRIPT_Q = Q(transcription__transcript__isnull=False) & ~Q(transcription__transcript="") & ~Q(transcription__transcript=None)
+
+
 class Utterance(models.Model):
     # If transcription is None and failure_data is not None, then the transcription failed
     # If transcription is not None and failure_data is None, then the transcription succeeded
@@ -1132,6 +1156,14 @@ class Utterance(models.Model):
 
     source = models.IntegerField(choices=Sources.choices, default=Sources.PER_PARTICIPANT_AUDIO, null=False)
 
+    class Meta:
+        indexes = [
+            # Supports keyset pagination of transcripts in TranscriptView
+            models.Index(fields=["recording", "updated_at", "id"], name="utterance_rec_updated_idx"),
+            # Supports fetching a recording's transcript in timeline order
+            models.Index(fields=["recording", "timestamp_ms"], condition=NON_EMPTY_TRANSCRIPT_Q, name="utterance_rec_ts_transcript_idx"),
+        ]
+
     def __str__(self):
         return f"Utterance at {self.timestamp_ms}ms ({self.duration_ms}ms long)"
 
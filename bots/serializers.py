@@ -599,7 +599,7 @@ class BotSerializer(serializers.ModelSerializer):
         }
     )
     def get_transcription_state(self, obj):
-        default_recording = Recording.objects.filter(bot=obj, is_default_recording=True).first()
+        default_recording = obj.default_recording()
         if not default_recording:
             return None
 
@@ -612,7 +612,7 @@ class BotSerializer(serializers.ModelSerializer):
         }
     )
     def get_recording_state(self, obj):
-        default_recording = Recording.objects.filter(bot=obj, is_default_recording=True).first()
+        default_recording = obj.default_recording()
         if not default_recording:
             return None
 
@@ -641,6 +641,11 @@ class TranscriptUtteranceSerializer(serializers.Serializer):
     transcription = serializers.JSONField()
 
 
+class TranscriptPageSerializer(serializers.Serializer):
+    utterances = TranscriptUtteranceSerializer(many=True)
+    next_cursor = serializers.CharField(allow_blank=True, help_text="Pass this as the cursor query parameter to get entries updated or created after this page")
+
+
 @extend_schema_serializer(
     examples=[
         OpenApiExample(
@@ -1,4 +1,5 @@
 from .deliver_webhook_task import deliver_webhook
+from .launch_bot_task import launch_bot_task
 from .process_utterance_task import process_utterance
 from .restart_bot_pod_task import restart_bot_pod
 from .run_bot_task import run_bot
@@ -9,4 +10,5 @@ __all__ = [
     "run_bot",
     "deliver_webhook",
     "restart_bot_pod",
+    "launch_bot_task",
 ]
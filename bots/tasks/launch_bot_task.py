@@ -0,0 +1,21 @@
+import logging
+
+from celery import shared_task
+
+from bots.models import Bot
+
+logger = logging.getLogger(__name__)
+
+
+# Only makes a single pod create call, so it shouldn't run for long
+@shared_task(soft_time_limit=60)
+def launch_bot_task(bot_id):
+    """
+    Create the Kubernetes pod for a bot outside of the request that created it.
+    """
+    # Imported here to avoid a circular import, since bots_api_utils imports the tasks package
+    from bots.bots_api_utils import create_bot_pod
+
+    logger.info(f"Creating pod for bot {bot_id}")
+    bot = Bot.objects.get(id=bot_id)
+    create_bot_pod(bot)
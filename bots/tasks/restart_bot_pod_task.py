@@ -7,7 +7,7 @@ from kubernetes import client, config
 from bots.models import Bot, BotEventTypes
 
 logger = logging.getLogger(__name__)
-from bots.bot_pod_creator import BotPodCreator
+from bots.bot_pod_creator import get_bot_pod_creator
 
 
 @shared_task(bind=True, soft_time_limit=3600)
@@ -78,7 +78,7 @@ def restart_bot_pod(self, bot_id):
     bot.last_heartbeat_timestamp = None
     bot.save()
 
-    bot_pod_creator = BotPodCreator()
+    bot_pod_creator = get_bot_pod_creator()
     bot_pod_create_result = bot_pod_creator.create_bot_pod(bot_id=bot.id, bot_name=bot.k8s_pod_name())
 
     logger.info(f"Bot pod create result: {bot_pod_create_result}")
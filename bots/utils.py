@@ -1,3 +1,4 @@
+import functools
 import io
 
 import cv2
@@ -402,6 +403,8 @@ def domain_and_subdomain_from_url(url):
     return extract_from_url.subdomain + "." + extract_from_url.registered_domain
 
 
+# Bots are often created for the same meeting URL, and tldextract parsing isn't free
+@functools.lru_cache(maxsize=4096)
 def meeting_type_from_url(url):
     if not url:
         return None
@@ -419,7 +422,7 @@ def meeting_type_from_url(url):
         return None
 
 
-def transcription_provider_from_meeting_url_and_transcription_settings(url, settings):
+def transcription_provider_from_meeting_url_and_transcription_settings(url, settings, meeting_type=None):
     if "deepgram" in settings:
         return TranscriptionProviders.DEEPGRAM
     elif "gladia" in settings:
@@ -430,7 +433,9 @@ def transcription_provider_from_meeting_url_and_transcription_settings(url, sett
         return TranscriptionProviders.CLOSED_CAPTION_FROM_PLATFORM
 
     # Return default provider. Which is deepgram for Zoom, and meeting_closed_captions for Google Meet / Teams
-    if meeting_type_from_url(url) == MeetingTypes.ZOOM:
+    if meeting_type is None:
+        meeting_type = meeting_type_from_url(url)
+    if meeting_type == MeetingTypes.ZOOM:
         return TranscriptionProviders.DEEPGRAM
     return TranscriptionProviders.CLOSED_CAPTION_FROM_PLATFORM
 
@@ -1,5 +1,4 @@
 import os
-import ssl
 
 from celery import Celery
 
@@ -11,5 +10,5 @@ app = Celery("mi")
 # Load configuration from Django settings
 app.config_from_object("django.conf:settings", namespace="CELERY")
 
-# Auto-discover tasks from all registered Django apps
-app.autodiscover_tasks()
+# Only the bots app defines tasks, so don't scan every installed app for a tasks module
+app.autodiscover_tasks(["bots"])
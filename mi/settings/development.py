@@ -3,10 +3,9 @@ import os
 from .base import *
 
 DEBUG = False
-ALLOWED_HOSTS = ["*"]
+# Comma separated, e.g. "meetinsights.in,localhost". Defaults to allowing any host.
+ALLOWED_HOSTS = [host.strip() for host in os.getenv("ALLOWED_HOSTS", "*").split(",") if host.strip()]
 
-print('NAGA')
-print(os.getenv("POSTGRES_DB"))
 DATABASES = {
     "default": {
         "ENGINE": "django.db.backends.postgresql",
@@ -15,13 +14,12 @@ DATABASES = {
         "PASSWORD": os.getenv("POSTGRES_PASSWORD"),
         "HOST": os.getenv("POSTGRES_HOST"),
         "PORT": os.getenv("POSTGRES_PORT"),
+        # Keep connections open between requests instead of reconnecting every time
+        "CONN_MAX_AGE": 60,
+        "CONN_HEALTH_CHECKS": True,
     }
 }
 
-print(DATABASES)
-
-
-
 # Log more stuff in development
 LOGGING = {
     "version": 1,